@@ -1,5 +1,6 @@
 import logging
-from unittest.mock import patch
+from typing import Any, Dict, Tuple
+from unittest.mock import MagicMock
 
 __all__ = (
     'PatchLogger',
@@ -26,22 +27,38 @@ class PatchLogger:
     """
     def __init__(self, logger: logging.Logger):
         self._logger: logging.Logger = logger
-        self._patchers = []
-
-        for method_name in ('debug', 'info', 'error', 'warning', 'critical'):
-            self._patchers.append(patch.object(self._logger, method_name, side_effect=self._mock_log_method))
+        self._method_names: Tuple[str, ...] = ('debug', 'info', 'error', 'warning', 'critical')
+        """ names of the logger methods to patch """
+        self._mocks: Dict[str, MagicMock] = {}
+        """ mocks assigned to the logger instead of its methods, they are created in __enter__ """
+        self._originals: Dict[str, Any] = {}
+        """ methods of the logger, which were set in the instance itself, to restore in __exit__ """
 
     # noinspection PyUnusedLocal
     @staticmethod
     def _mock_log_method(msg, *args, **kwargs):
-        msg % tuple(arg for arg in args)
+        msg % args
 
     def __enter__(self) -> 'PatchLogger':
-        for patcher in self._patchers:
-            patcher.__enter__()
+        logger_dict: Dict[str, Any] = self._logger.__dict__
+        self._mocks = {
+            method_name: MagicMock(side_effect=self._mock_log_method) for method_name in self._method_names
+        }
+        self._originals = {
+            method_name: logger_dict[method_name] for method_name in self._method_names if method_name in logger_dict
+        }
+
+        for method_name, mock in self._mocks.items():
+            setattr(self._logger, method_name, mock)
 
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        for patcher in reversed(self._patchers):
-            patcher.__exit__(None, None, None)
+        for method_name in self._mocks:
+            if method_name in self._originals:
+                setattr(self._logger, method_name, self._originals[method_name])
+            else:
+                delattr(self._logger, method_name)  # the method of the logger class becomes visible again
+
+        self._mocks = {}
+        self._originals = {}
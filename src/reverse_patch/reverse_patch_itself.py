@@ -1,10 +1,19 @@
-from typing import Callable, List, ContextManager, Set, Optional, Dict, NewType, Union, Any, cast
-from types import ModuleType
+from typing import (
+    AbstractSet, Callable, FrozenSet, Iterable, List, ContextManager, Set, Optional, Dict, NewType, Union, Any, Tuple,
+    Type, cast,
+)
+from types import MethodType, ModuleType
 import logging
 import dataclasses
+import functools
+import operator
 import sys
 import inspect
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, MagicMock, DEFAULT, create_autospec
+try:
+    from unittest.mock import AsyncMock
+except ImportError:  # python 3.7
+    AsyncMock = MagicMock  # type: ignore
 from .patch_logger import PatchLogger
 
 __all__ = (
@@ -84,33 +93,59 @@ class ArgsKwargs(list):
     # `c(*args_kwargs)` the same as `c(m0, m1)`
     ```
     """
-    _index_map: Dict[ArgumentName, ArgumentIndex] = {}  # {'argument name': argument index}
+    __slots__ = ('_index_map',)
 
     def __init__(self, *args: Any, **kwargs: Any):
         super().__init__(*args, **kwargs)
-        self._index_map: Dict[ArgumentName, ArgumentIndex] = {}
+        self._index_map: Dict[ArgumentName, ArgumentIndex] = {}  # {'argument name': argument index}
 
-    def __getattr__(self, item: str) -> MagicMock:
-        try:
-            return super().__getitem__(self._index_map[ArgumentName(item)])
-        except KeyError:
+    def __getattr__(self, item: str) -> Mock:
+        if item == '_index_map':
+            raise AttributeError(item)  # `_index_map` is not set yet, e.g. while copying
+
+        index: Optional[ArgumentIndex] = self._index_map.get(ArgumentName(item))
+        if index is None:
             raise AttributeError(item)
 
-    def __setattr__(self, key: str, value: MagicMock):
-        if key not in dir(self):
-            super().__setitem__(self._index_map[ArgumentName(key)], value)
-        else:
+        return list.__getitem__(self, index)
+
+    def __setattr__(self, key: str, value: Mock):
+        if hasattr(type(self), key):  # the `_index_map` slot or an attribute of list, no `dir(self)` per call
             super().__setattr__(key, value)
+        else:
+            list.__setitem__(self, self._index_map[ArgumentName(key)], value)
 
-    def add_argument(self, argument_name: ArgumentName, argument_value: MagicMock) -> None:
+    def add_argument(self, argument_name: ArgumentName, argument_value: Mock) -> None:
         """Adds argument and its value to this list"""
-        self._index_map[argument_name] = ArgumentIndex(len(self._index_map))
-        super().append(argument_value)
+        self._index_map[argument_name] = ArgumentIndex(len(self))  # index of the value appended below
+        list.append(self, argument_value)
+
+    def get_argument(self, argument_name: ArgumentName, default: Optional[Mock] = None) -> Optional[Mock]:
+        """Returns the value of the argument by its name or default, if there is no such argument"""
+        index: Optional[ArgumentIndex] = self._index_map.get(argument_name)
+        return default if index is None else list.__getitem__(self, index)
+
+    def add_arguments(self, arguments: Iterable[Tuple[ArgumentName, Mock]]) -> None:
+        """
+        Adds arguments and their values to this list at once
+
+        ```py
+        args_kwargs.add_arguments([(ArgumentName('self'), m0), (ArgumentName('x'), m1)])
+        ```
+        """
+        arguments_: List[Tuple[ArgumentName, Mock]] = list(arguments)
+        start: int = len(self)
+        self._index_map.update(cast(Dict[ArgumentName, ArgumentIndex], {  # NewType is identity at runtime
+            argument_name: start + offset for offset, (argument_name, _) in enumerate(arguments_)
+        }))
+        list.extend(self, [argument_value for _, argument_value in arguments_])
 
 
 @dataclasses.dataclass
 class CallableDTO:
     """Information of excluded from patching (mocking) callable object"""
+    __slots__ = ('args', 'c')
+
     args: ArgsKwargs
     """
     The list of arguments, 
@@ -123,6 +158,8 @@ class CallableDTO:
 @dataclasses.dataclass
 class NotCallableDTO:
     """Information of excluded from patching (mocking) not_callable object"""
+    __slots__ = ('o',)
+
     o: Any
     """excluded object itself"""
 
@@ -132,6 +169,7 @@ class ReversePatchDTO:
     """
     Patching result. Mock arguments and callable to call.
     """
+    __slots__ = ('args', 'c', 'exclusions')
 
     args: ArgsKwargs
     """
@@ -153,12 +191,140 @@ class ReversePatchDTO:
         yield self
         yield self.c
         yield self.args
-        yield getattr(self.args, 'self', getattr(self.args, 'cls', None))
+        yield self.args.get_argument(ArgumentName('self'), self.args.get_argument(ArgumentName('cls')))
+
 
+_ExcludePath = Tuple[IdentifierPath, Tuple[IdentifierName, ...], Callable[[Any], Any]]
+"""
+The path of an excluded object, its identifiers split once and its `operator.attrgetter`,
+like ('A.b', ('A', 'b'), attrgetter('A.b'))
+"""
 
-class FakeModule:
-    def __init__(self, tm):
-        self.tm = tm
+
+@dataclasses.dataclass(frozen=True)
+class _ExclusionIndex:
+    """Exclusions of `ReversePatch` normalized once in `__init__`, to be only read in `__enter__`"""
+    __slots__ = ('identifiers', 'paths', 'include_paths')
+
+    identifiers: FrozenSet[IdentifierName]
+    """identifiers of the testing module, which stay original, including the first identifiers of excluded paths"""
+    paths: Tuple[_ExcludePath, ...]
+    """paths of all excluded objects, each with its identifiers split once and its getter"""
+    include_paths: Tuple[Tuple[Tuple[IdentifierName, ...], IdentifierName], ...]
+    """
+    identifiers of include set, that are not excluded, split once into parents and the attribute,
+    like (('A',), 'b') for 'A.b'. exclude_set has more priority than include_set
+    """
+
+
+class _ModuleDictPatch:
+    """
+    Replaces identifiers of a module with a single `__dict__` update and restores originals on exit.
+
+    It works like a bunch of `patch.object(module, identifier, value)`,
+    but without creating and entering a patcher for each identifier.
+    """
+    __slots__ = ('_module', '_replacements', '_originals')
+
+    def __init__(self, module: ModuleType, replacements: Dict[IdentifierName, Any]):
+        self._module: ModuleType = module
+        self._replacements: Dict[IdentifierName, Any] = replacements
+        self._originals: Dict[IdentifierName, Any] = {}
+
+    def __enter__(self) -> ModuleType:
+        module_dict: Dict[IdentifierName, Any] = cast(Dict[IdentifierName, Any], self._module.__dict__)
+        self._originals = {identifier: module_dict[identifier] for identifier in self._replacements}
+        module_dict.update(self._replacements)
+        return self._module
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        cast(Dict[IdentifierName, Any], self._module.__dict__).update(self._originals)
+        self._originals = {}
+
+
+class _DirectPatch:
+    """
+    Sets an attribute of an object on enter and restores it on exit.
+
+    It works like `patch.object(target, attribute, new, create=create)`,
+    but assigns the attribute directly, without the patcher machinery of `unittest.mock`.
+    """
+    __slots__ = ('_target', '_attribute', '_new', '_create', '_original', '_is_local')
+
+    def __init__(self, target: Any, attribute: str, new: Any, create: bool = False):
+        self._target: Any = target
+        self._attribute: str = attribute
+        self._new: Any = new
+        self._create: bool = create
+        self._original: Any = DEFAULT
+        self._is_local: bool = False
+
+    def __enter__(self) -> Any:
+        try:
+            self._original = self._target.__dict__[self._attribute]
+            self._is_local = True
+        except (AttributeError, KeyError):
+            self._original = getattr(self._target, self._attribute, DEFAULT)
+            self._is_local = False
+
+        if self._original is DEFAULT and not self._create:
+            raise AttributeError(f'{self._target} does not have the attribute {self._attribute!r}')
+
+        setattr(self._target, self._attribute, self._new)
+        return self._new
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self._is_local:
+            setattr(self._target, self._attribute, self._original)
+        else:
+            delattr(self._target, self._attribute)
+
+            if self._original is not DEFAULT and not hasattr(self._target, self._attribute):
+                setattr(self._target, self._attribute, self._original)
+
+        self._original = DEFAULT
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_parameter_names(func: Callable) -> Tuple[ArgumentName, ...]:
+    """
+    Returns names of parameters of the method or the function.
+
+    The result of `inspect.signature` depends only on the callable, so it is cached for the next `__enter__`.
+    Bound methods are cached as is, they are equal while they are bound to the same object and function,
+    and their signatures do not include `self` or `cls`.
+    """
+    return tuple(ArgumentName(param_name) for param_name in inspect.signature(func).parameters)
+
+
+@functools.lru_cache(maxsize=1024)
+def _module_of(func: Callable) -> ModuleType:
+    """
+    Returns the module where the function is defined.
+
+    `__init__` passes `__func__` of a bound method, so all methods bound to different objects share one cache entry.
+    """
+    return sys.modules[getattr(func, '__module__')]
+
+
+@functools.lru_cache(maxsize=1024)
+def _qualname_path(func: Callable) -> Tuple[str, ...]:
+    """
+    Returns names of classes in path to the method, the function itself is not included.
+
+    example: `('FirstClass', 'SecondClass')` for `FirstClass.SecondClass.testing_method`
+    """
+    return tuple(func.__qualname__.split('.')[:-1])
+
+
+def _split_include_path(include_path: str) -> Tuple[Tuple[IdentifierName, ...], IdentifierName]:
+    """
+    Splits the path of include set into identifiers of parents and the attribute.
+
+    example: `(('A',), 'b')` for `'A.b'`, `((), 'type')` for `'type'`
+    """
+    identifiers: List[str] = include_path.split('.')
+    return tuple(IdentifierName(identifier) for identifier in identifiers[:-1]), IdentifierName(identifiers[-1])
 
 
 class ReversePatch:
@@ -183,7 +349,7 @@ class ReversePatch:
     ```
     """
 
-    _include_set: Set[Union[IdentifierName, IdentifierPath]] = {IdentifierName('id')}
+    _include_set: AbstractSet[Union[IdentifierName, IdentifierPath]] = frozenset({IdentifierName('id')})
     """
     Identifiers (variables) names or qualified names which have to be mocked
 
@@ -197,7 +363,7 @@ class ReversePatch:
         tm.something.assert_called_once_with(type_=tm.type.return_value)  # using mocked `type` return value
     ```
     """
-    _exclude_set: Set[Union[IdentifierName, IdentifierPath, Callable]] = set()
+    _exclude_set: AbstractSet[Union[IdentifierName, IdentifierPath, Callable]] = frozenset()
     """
     Identifiers (variables) names or objects which have to be excluded from mocking
 
@@ -217,13 +383,16 @@ class ReversePatch:
     _exclude_object_set: Set[Callable] = set()
     _exclude_object_path_set: Set[IdentifierPath] = set()
     _exclude_first_object_path_identifier_set: Set[IdentifierName] = set()
+    _exclude_path_parts: Tuple[_ExcludePath, ...] = ()
+    """ paths of all excluded objects, each with its identifiers split once and its getter """
     # endregion exclusions
 
     def __init__(
         self,
         func: Callable,
-        include_set: Optional[Set[Union[IdentifierName, IdentifierPath, str]]] = None,
-        exclude_set: Optional[Set[Union[IdentifierName, IdentifierPath, Callable, str]]] = None
+        include_set: Optional[AbstractSet[Union[IdentifierName, IdentifierPath, str]]] = None,
+        exclude_set: Optional[AbstractSet[Union[IdentifierName, IdentifierPath, Callable, str]]] = None,
+        include_magic: bool = True,
     ):
         """
 
@@ -232,31 +401,59 @@ class ReversePatch:
         :param exclude_set: set of identifiers (variables) names, which will excluding from mocking, like: {'my_func'}
           or set of object, which need to be excluded from mocking, like: {tm.FirstClass.__init__}
           or set of python paths, like {'FirstClass.__init__'}
+        :param include_magic: if True (default) mocked arguments are `MagicMock` instances,
+          otherwise they are plain `Mock` instances, which are cheaper to create, but do not support magic methods
 
         Note: exclude_set has more priority than include_set.
         """
         self._func: Callable = func
         """ testing function or method """
+        self._argument_mock_class: Type[Mock] = MagicMock if include_magic else Mock
+        """ class of mocks created for arguments of the testing function or method and excluded callables """
+        self._get_func_args_and_callable: Callable[..., CallableDTO] = (
+            self._get_class_method_args_and_callable if self.is_class_method(class_method=func)
+            else self._get_function_args_and_callable
+        )
+        """ builder of arguments and callable for the testing function or method, chosen once """
+        self._testing_module: ModuleType = _module_of(getattr(func, '__func__', func))
+        """ the module of the testing function or method """
+        self._qualname_parts: Tuple[str, ...] = _qualname_path(func)
+        """ names of classes in path to the testing method, like ('FirstClass', 'SecondClass') """
         self._patchers: List[ContextManager] = []
         """ Applied patchers in __enter__, to exit in __exit__ """
 
-        if include_set:
-            self._include_set: Set[Union[IdentifierName, IdentifierPath]] = (
-                    self._include_set | cast(Set[Union[IdentifierName, IdentifierPath]], include_set)
-            )
-            """
-            set of identifiers (variables) names, which need to be mocked, like: {'type'}
-            """
+        self._include_set: FrozenSet[Union[IdentifierName, IdentifierPath]] = frozenset(
+            type(self)._include_set | cast(Set[Union[IdentifierName, IdentifierPath]], include_set or set())
+        )
+        """
+        set of identifiers (variables) names, which need to be mocked, like: {'type'}
+        """
+        self._exclude_set: FrozenSet[Union[IdentifierName, IdentifierPath, Callable]] = frozenset(
+            type(self)._exclude_set | cast(Set[Union[IdentifierName, IdentifierPath, Callable]], exclude_set or set())
+        )
+        """
+        set of identifiers (variables) names, which will excluding from mocking, like: {'my_func'}
+        """
 
         if exclude_set:
-            self._exclude_set: Set[Union[IdentifierName, IdentifierPath, Callable]] = (
-                    self._exclude_set | cast(Set[Union[IdentifierName, IdentifierPath, Callable]], exclude_set)
-            )
-            """
-            set of identifiers (variables) names, which will excluding from mocking, like: {'my_func'}
-            """
             self._init_exclusions()
 
+        # exclude_set has more priority than include_set
+        include_path_set: FrozenSet[str] = self._include_set - (
+            self._exclude_identifier_set | self._exclude_path_set | self._exclude_object_path_set
+        )
+
+        self._exclusion_index: _ExclusionIndex = _ExclusionIndex(
+            identifiers=frozenset(
+                self._exclude_identifier_set
+                | self._exclude_first_path_identifier_set
+                | self._exclude_first_object_path_identifier_set
+            ),
+            paths=self._exclude_path_parts,
+            include_paths=tuple(_split_include_path(include_path) for include_path in include_path_set),
+        )
+        """ exclusions normalized once, to be only read in __enter__ """
+
     def _init_exclusions(self) -> None:
         exclude_path_set: Set[IdentifierPath] = {
             IdentifierPath(exclude_path) for exclude_path in self._exclude_set
@@ -290,39 +487,45 @@ class ReversePatch:
         self._exclude_first_object_path_identifier_set = (
             self._exclude_first_object_path_identifier_set | exclude_first_object_path_identifier_set
         )
+        self._exclude_path_parts = tuple(
+            (
+                exclude_path,
+                cast(Tuple[IdentifierName, ...], tuple(exclude_path.split('.'))),
+                operator.attrgetter(exclude_path),
+            )
+            for exclude_path in self._exclude_path_set | self._exclude_object_path_set
+        )
 
     def _get_testing_module(self) -> ModuleType:
         """Returns the module of the testing function or method"""
-        module_path: str = getattr(self._func, '__module__')
-        testing_module: ModuleType = sys.modules[module_path]
-        return testing_module
+        return self._testing_module
 
     def __enter__(self) -> ReversePatchDTO:
         testing_module: ModuleType = self._get_testing_module()
-        fake_parent_module = FakeModule(tm=testing_module)
+        # the same autospec, that `patch.object(parent, 'tm', autospec=True)` creates, but without a fake parent
+        mocked_module: MagicMock = create_autospec(testing_module, _name='tm')
+        patching_list: List[MagicMock] = self._walk_patching_list(names=self._qualname_parts, mock_module=mocked_module)
 
-        patcher = patch.object(fake_parent_module, 'tm', autospec=True)
-        self._patchers.append(patcher)
-        mocked_module = patcher.__enter__()
-        patching_list: List[MagicMock] = self.get_patching_list(test_method=self._func, mock_module=mocked_module)
-
-        args_kwargs_dto: CallableDTO = self._get_args_and_callable(func=self._func, patching_list=patching_list)
+        args_kwargs_dto: CallableDTO = self._get_func_args_and_callable(
+            func=self._func, patching_list=patching_list, argument_mock_class=self._argument_mock_class,
+        )
         args: ArgsKwargs = args_kwargs_dto.args
         c: Callable = args_kwargs_dto.c
 
         self._patch_module_identifiers(
             testing_module=testing_module, mocked_module=mocked_module, patching_list=patching_list
         )
-        self._patch_include_set(testing_module=testing_module)
+        if self._exclusion_index.include_paths:
+            self._patch_include_set(testing_module=testing_module)
 
         exclusions: Dict[Union[Callable, IdentifierPath], Union[CallableDTO, NotCallableDTO]] = {}
-        all_exclude_set = self._exclude_path_set | self._exclude_object_path_set
 
         exclude_path: IdentifierPath
-        for exclude_path in all_exclude_set:
-            exclude_object: Callable = self._getattr_by_path(obj=testing_module, path=exclude_path)
+        exclude_identifiers: Tuple[IdentifierName, ...]
+        exclude_getter: Callable[[Any], Any]
+        for exclude_path, exclude_identifiers, exclude_getter in self._exclusion_index.paths:
+            exclude_object: Callable = exclude_getter(testing_module)
 
-            exclude_identifiers: List[IdentifierName] = cast(List[IdentifierName], exclude_path.split('.'))
             if len(exclude_identifiers) < 2:
                 raise ValueError(f'len(exclude_identifiers)<2')
 
@@ -334,41 +537,41 @@ class ReversePatch:
                 for idx, exclude_identifier in enumerate(exclude_identifiers):
                     current_object = getattr(parent_object, exclude_identifier)
 
-                    if len(patching_list) > idx and patching_list[idx] == current_object:
+                    if idx < (len(exclude_identifiers) - 1):
+                        pass  # intermediate objects are already attributes of their parents, nothing to patch
+                    elif len(patching_list) > idx and patching_list[idx] == current_object:
                         pass
                     else:
-                        if idx < (len(exclude_identifiers) - 1):
-                            patcher = patch.object(parent_object, exclude_identifier, current_object)
+                        if exclude_identifier == '__init__':
+                            # it is not possible to set `__init__` attribute in MagicMock instance
+                            # in case of `__init__` use `m__init__` instead
+                            patcher = _DirectPatch(
+                                target=parent_object,
+                                attribute=f'm{exclude_identifier}',
+                                new=exclude_object,
+                                create=True,
+                            )
                         else:
-                            if exclude_identifier == '__init__':
-                                # it is not possible to set `__init__` attribute in MagicMock instance
-                                # in case of `__init__` use `m__init__` instead
-                                patcher = patch.object(
-                                    parent_object,
-                                    f'm{exclude_identifier}',
-                                    cast(Mock, exclude_object),  # mypy hack
-                                    create=True,
-                                )
-                            else:
-                                patcher = patch.object(
-                                    parent_object,
-                                    exclude_identifier,
-                                    cast(Mock, exclude_object),  # mypy hack
-                                )
-
-                            if callable(exclude_object):
-                                callable_exclusion_dto: CallableDTO = self._get_args_and_callable(
-                                    func=exclude_object,
-                                    patching_list=[parent_object],
-                                )
-                                exclusions[exclude_object] = callable_exclusion_dto
-                                exclusions[exclude_path] = callable_exclusion_dto
-                            else:
-                                not_callable_exclusion_dto: NotCallableDTO = NotCallableDTO(o=exclude_object)
-                                # in case of not_callable object exclusion, we cannot put it as a key of
-                                # the exclusion dict
-                                # exclusions[exclude_object] = not_callable_exclusion_dto  # don't uncomment !!
-                                exclusions[exclude_path] = not_callable_exclusion_dto
+                            patcher = _DirectPatch(
+                                target=parent_object,
+                                attribute=exclude_identifier,
+                                new=exclude_object,
+                            )
+
+                        if callable(exclude_object):
+                            callable_exclusion_dto: CallableDTO = self._get_args_and_callable(
+                                func=exclude_object,
+                                patching_list=[parent_object],
+                                argument_mock_class=self._argument_mock_class,
+                            )
+                            exclusions[exclude_object] = callable_exclusion_dto
+                            exclusions[exclude_path] = callable_exclusion_dto
+                        else:
+                            not_callable_exclusion_dto: NotCallableDTO = NotCallableDTO(o=exclude_object)
+                            # in case of not_callable object exclusion, we cannot put it as a key of
+                            # the exclusion dict
+                            # exclusions[exclude_object] = not_callable_exclusion_dto  # don't uncomment !!
+                            exclusions[exclude_path] = not_callable_exclusion_dto
 
                         patcher.__enter__()
                         self._patchers.append(patcher)
@@ -378,28 +581,19 @@ class ReversePatch:
         return ReversePatchDTO(args=args, c=c, exclusions=exclusions)
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        for patcher in reversed(self._patchers):
-            patcher.__exit__(exc_type, exc_val, exc_tb)
+        """ Exits all applied patchers in reverse order, even if some of them fail, then raises the first error """
+        errors: List[BaseException] = []
 
-    @staticmethod
-    def _getattr_by_path(obj: Any, path: IdentifierPath) -> Callable:
-        """
-        example:
-
-        ```py
-        class X:
-            class Y:
-                t = 4
-
-        print(getattr_by_path(X, 'Y.t'))  # prints 4
-        ```
-        """
-        obj_ = obj
+        for patcher in reversed(self._patchers):
+            try:
+                patcher.__exit__(exc_type, exc_val, exc_tb)
+            except Exception as e:
+                errors.append(e)
 
-        for path_item in path.split('.'):
-            obj_ = getattr(obj_, path_item)
+        self._patchers.clear()
 
-        return obj_
+        if errors:
+            raise errors[0]
 
     @staticmethod
     def _get_exclude_object_path(exclude_object: Callable) -> IdentifierPath:
@@ -412,32 +606,56 @@ class ReversePatch:
         return exclude_object_path
 
     @classmethod
-    def _get_args_and_callable(cls, func: Callable, patching_list: List[MagicMock]) -> CallableDTO:
+    def _get_args_and_callable(
+        cls,
+        func: Callable,
+        patching_list: List[MagicMock],
+        argument_mock_class: Type[Mock] = MagicMock,
+    ) -> CallableDTO:
+        if cls.is_class_method(class_method=func):
+            return cls._get_class_method_args_and_callable(
+                func=func, patching_list=patching_list, argument_mock_class=argument_mock_class,
+            )
+
+        return cls._get_function_args_and_callable(
+            func=func, patching_list=patching_list, argument_mock_class=argument_mock_class,
+        )
+
+    @staticmethod
+    def _get_class_method_args_and_callable(
+        func: Callable,
+        patching_list: List[MagicMock],
+        argument_mock_class: Type[Mock] = MagicMock,
+    ) -> CallableDTO:
+        """ `cls` is the mock of the class, the callable is the function of the classmethod """
         args = ArgsKwargs()
-        params = inspect.signature(func).parameters
-        c: Callable = func
 
-        if cls.is_class_method(class_method=func):
-            c = getattr(func, '__func__')
+        if len(patching_list):
+            args.add_argument(argument_name=ArgumentName('cls'), argument_value=patching_list[-1])
 
-            if len(patching_list):
-                args.add_argument(argument_name=ArgumentName('cls'), argument_value=patching_list[-1])
+        args.add_arguments((param_name, argument_mock_class()) for param_name in _get_parameter_names(func))
+        return CallableDTO(args=args, c=getattr(func, '__func__'))
 
-            param_name: str
-            for param_name in params.keys():
-                args.add_argument(argument_name=ArgumentName(param_name), argument_value=MagicMock())
-        else:
-            param_name_: str
-            for param_name_ in params.keys():
-                if len(patching_list):
-                    if param_name_ == 'self':
-                        args.add_argument(argument_name=ArgumentName(param_name_), argument_value=patching_list[-1])
-                    else:
-                        args.add_argument(argument_name=ArgumentName(param_name_), argument_value=MagicMock())
-                else:
-                    args.add_argument(argument_name=ArgumentName(param_name_), argument_value=MagicMock())
+    @staticmethod
+    def _get_function_args_and_callable(
+        func: Callable,
+        patching_list: List[MagicMock],
+        argument_mock_class: Type[Mock] = MagicMock,
+    ) -> CallableDTO:
+        """ `self` of methods is the mock of the class, other arguments are new mocks """
+        args = ArgsKwargs()
+        param_names: Tuple[ArgumentName, ...] = _get_parameter_names(func)
 
-        return CallableDTO(args=args, c=c)
+        if not len(patching_list):
+            args.add_arguments((param_name, argument_mock_class()) for param_name in param_names)
+            return CallableDTO(args=args, c=func)
+
+        self_mock: MagicMock = patching_list[-1]
+        args.add_arguments(
+            (param_name, self_mock if param_name == 'self' else argument_mock_class())
+            for param_name in param_names
+        )
+        return CallableDTO(args=args, c=func)
 
     def _patch_module_identifiers(
         self,
@@ -446,70 +664,67 @@ class ReversePatch:
         patching_list: List[MagicMock]
     ):
         """ Move mocks from mocked_module to testing_module """
-        identifier: IdentifierName  # The name of the attribute (variable) in the testing module
-        for identifier, identifier_value in cast(Dict[IdentifierName, Any], testing_module.__dict__.copy()).items():
-            all_exclude: Set[IdentifierName] = (
-                self._exclude_identifier_set
-                | self._exclude_first_path_identifier_set
-                | self._exclude_first_object_path_identifier_set
-            )
-
-            if identifier in all_exclude:
-                continue
-
-            if (
-                identifier.startswith('__')  # skip magics,
-                and identifier not in self._include_set  # if identifier is set to be mocked explicitly
-            ):
-                continue
-
-            if identifier_value is self._func:
-                continue
-
-            if isinstance(identifier_value, Mock):
-                continue  # do not mock that has already mocked
-
-            if inspect.isclass(identifier_value) and issubclass(identifier_value, Exception):
-                continue  # skip exception classes
+        all_exclude: AbstractSet[IdentifierName] = self._exclusion_index.identifiers
+
+        if len(patching_list):
+            # the first class in path to the testing method stays original in the testing module
+            all_exclude = all_exclude | {IdentifierName(getattr(patching_list[0], '_mock_name'))}
+
+        include_set: AbstractSet[Union[IdentifierName, IdentifierPath]] = self._include_set
+        func: Callable = self._func
+
+        # identifier is the name of the attribute (variable) in the testing module
+        replacements: Dict[IdentifierName, Any] = {
+            identifier: getattr(mocked_module, identifier)
+            for identifier, identifier_value in tuple(cast(Dict[IdentifierName, Any], testing_module.__dict__).items())
+            if identifier not in all_exclude
+            # skip magics, if identifier is not set to be mocked explicitly
+            and (identifier[:2] != '__' or identifier in include_set)
+            and identifier_value is not func
+            and not isinstance(identifier_value, Mock)  # do not mock that has already mocked
+            and not (isinstance(identifier_value, type) and issubclass(identifier_value, Exception))  # skip exceptions
+        }
 
-            if len(patching_list) and identifier == getattr(patching_list[0], '_mock_name'):
-                continue  #
+        if not replacements:
+            return
 
-            identifier_patcher: ContextManager = patch.object(
-                testing_module, identifier, getattr(mocked_module, identifier)
-            )
-            identifier_patcher.__enter__()
-            self._patchers.append(identifier_patcher)
+        module_patcher: ContextManager = _ModuleDictPatch(module=testing_module, replacements=replacements)
+        module_patcher.__enter__()
+        self._patchers.append(module_patcher)
 
     def _patch_include_set(self, testing_module: ModuleType) -> None:
         """ patches identifiers in defined in include set """
-        exclude_set: Set[Union[IdentifierName, IdentifierPath]]
-        exclude_set = self._exclude_identifier_set | self._exclude_path_set | self._exclude_object_path_set
-
-        include_set: Set[Union[IdentifierName, IdentifierPath]]
-        include_set = self._include_set - exclude_set  # exclude_set has more priority than include_set
-
-        identifier_path: Union[IdentifierName, IdentifierPath]
-        for identifier_path in include_set:
+        parent_identifiers: Tuple[IdentifierName, ...]
+        attribute: IdentifierName
+        for parent_identifiers, attribute in self._exclusion_index.include_paths:
 
             parent = testing_module
 
             identifier: IdentifierName
-            for identifier in cast(List[IdentifierName], identifier_path.split('.')[:-1]):
+            for identifier in parent_identifiers:
                 parent = getattr(parent, identifier)
 
-            if isinstance(getattr(parent, identifier_path.split('.')[-1], None), Mock):
+            original = getattr(parent, attribute, None)
+
+            if isinstance(original, Mock):
                 # noinspection SpellCheckingInspection
                 continue  # python 3.10 does not not support autospec on that already mocked
 
-            patcher = patch.object(parent, identifier_path.split('.')[-1], create=True)
+            # the same choice as `patch` does, awaiting of an included coroutine function must still work
+            new: MagicMock = AsyncMock() if inspect.iscoroutinefunction(original) else MagicMock()
+            patcher: ContextManager = _DirectPatch(target=parent, attribute=attribute, new=new, create=True)
             patcher.__enter__()
             self._patchers.append(patcher)
 
     @classmethod
     def is_class_method(cls, class_method: Callable) -> bool:
-        """ True if method is classmethod, otherwise False """
-        is_class_method: bool = inspect.ismethod(class_method)
+        """
+        True if method is classmethod, otherwise False.
+
+        Any bound method is treated as a classmethod, the same as `inspect.ismethod` does,
+        but the exact type check is cheaper.
+        """
+        is_class_method: bool = type(class_method) is MethodType
         return is_class_method
 
     @classmethod
@@ -534,16 +749,19 @@ class ReversePatch:
         ]
         ```
         """
-        qualified_name: str = test_method.__qualname__
+        return cls._walk_patching_list(names=_qualname_path(test_method), mock_module=mock_module)
 
+    @staticmethod
+    def _walk_patching_list(names: Tuple[str, ...], mock_module: MagicMock) -> List[MagicMock]:
+        """ the same as `get_patching_list`, but names of classes in path to the testing method are already known """
         patching_list: List = []
-        names: List[str] = qualified_name.split('.')[:-1]
+        append: Callable = patching_list.append
         current_object = mock_module
 
         name: str
         for name in names:
             current_object = getattr(current_object, name)
-            patching_list.append(current_object)
+            append(current_object)
 
         return patching_list
 
@@ -556,6 +774,8 @@ class Rp(ReversePatch):
 @dataclasses.dataclass
 class ResultReversePatchDTO(ReversePatchDTO):
     """ReversePatchDTO with result of `rp.c(*rp.args)`"""
+    __slots__ = ('r',)
+
     r: Any
     """result of `rp.c(*rp.args)`"""
 
@@ -609,22 +829,23 @@ class Rcl(Rp):
     ```
     """
     _patch_logger_manager: Optional[PatchLogger] = None
+    _DEFAULT_LOG_EXCLUDES: FrozenSet[IdentifierName] = frozenset({IdentifierName('logging'), IdentifierName('logger')})
+    """ identifiers of the testing module, which are always excluded from mocking to check log calls """
 
     def __init__(
         self,
         func: Callable,
-        include_set: Optional[Set[Union[IdentifierName, IdentifierPath, str]]] = None,
-        exclude_set: Optional[Set[Union[IdentifierName, IdentifierPath, Callable, str]]] = None
+        include_set: Optional[AbstractSet[Union[IdentifierName, IdentifierPath, str]]] = None,
+        exclude_set: Optional[AbstractSet[Union[IdentifierName, IdentifierPath, Callable, str]]] = None,
+        include_magic: bool = True,
     ):
-        exclude_set_: Set[Union[IdentifierName, IdentifierPath, Callable, str]] = {
-            IdentifierName('logging'),
-            IdentifierName('logger'),
-        }
-
-        if exclude_set is not None:
-            exclude_set_ = exclude_set_ | exclude_set
+        exclude_set_: AbstractSet[Union[IdentifierName, IdentifierPath, Callable, str]] = (
+            self._DEFAULT_LOG_EXCLUDES if exclude_set is None else self._DEFAULT_LOG_EXCLUDES | exclude_set
+        )
 
-        super().__init__(func=func, include_set=include_set, exclude_set=exclude_set_)
+        super().__init__(
+            func=func, include_set=include_set, exclude_set=exclude_set_, include_magic=include_magic,
+        )
 
     def __enter__(self) -> ResultReversePatchDTO:
         rp: ReversePatchDTO = super().__enter__()
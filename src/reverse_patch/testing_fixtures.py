@@ -67,6 +67,9 @@ class FirstClass:
         type_ = type('hello')
         return type_
 
+    async def async_method(self):
+        raise RuntimeError('_async_method')
+
     @staticmethod
     def success_static_method__exclude():
         id_ = id('4')
@@ -0,0 +1,100 @@
+from typing import Any, Callable, Dict, FrozenSet, Optional, Set, Tuple
+import pytest
+
+from reverse_patch import ReversePatch, ReversePatchDTO
+import reverse_patch.testing_fixtures as tm
+
+
+SNAPSHOT_NAMESPACES: Dict[str, Any] = {
+    'tm': tm,
+    'tm.FirstClass': tm.FirstClass,
+    'tm.FirstClass.SecondClass': tm.FirstClass.SecondClass,
+    'tm.InitCase': tm.InitCase,
+}
+"""the testing module and its classes, whose attributes are patched by tests directly or via `include_set`"""
+
+
+@pytest.fixture(autouse=True)
+def tm_snapshot(request):
+    """
+    Fails the test that left attributes of `SNAPSHOT_NAMESPACES` changed, the leaked attributes are restored first.
+
+    Tests of `rp_cache` are skipped, their `ReversePatch` stays entered until the end of the class on purpose.
+    `rp_dto` is entered before the snapshot is taken, so its patches are not reported.
+    """
+    if 'rp_cache' in request.fixturenames:
+        yield
+        return
+
+    originals: Dict[str, Dict[str, Any]] = {name: dict(vars(obj)) for name, obj in SNAPSHOT_NAMESPACES.items()}
+    yield
+    missing = object()
+    leaked = []
+
+    for name, obj in SNAPSHOT_NAMESPACES.items():
+        original: Dict[str, Any] = originals[name]
+
+        for identifier in sorted(original.keys() | vars(obj).keys()):
+            if vars(obj).get(identifier, missing) is original.get(identifier, missing):
+                continue
+
+            leaked.append(f'{name}.{identifier}')
+
+            if identifier in original:
+                setattr(obj, identifier, original[identifier])
+            else:
+                delattr(obj, identifier)
+
+    assert not leaked, f'{request.node.name} left {leaked} patched'
+
+
+@pytest.fixture(scope='class')
+def rp_cache():
+    """
+    Enters `ReversePatch` once per target for the whole test class and returns the cached `ReversePatchDTO`.
+
+    The testing module stays patched until the last test of the class is done,
+    so use it only in classes whose tests share the same mocked scope and do not call `rp.c(*rp.args)`.
+
+    ```py
+    class TestSomething:
+        def test_something(self, rp_cache):
+            rp = rp_cache(tm.FirstClass.success_method)
+            assert isinstance(tm.MODULE_CONST, NonCallableMock)
+    ```
+    """
+    cache: Dict[Tuple[Callable, FrozenSet[Any], FrozenSet[Any]], Tuple[ReversePatch, ReversePatchDTO]] = {}
+
+    def get(
+        func: Callable,
+        include_set: Optional[Set[Any]] = None,
+        exclude_set: Optional[Set[Any]] = None,
+    ) -> ReversePatchDTO:
+        key = (func, frozenset(include_set or ()), frozenset(exclude_set or ()))
+
+        if key not in cache:
+            reverse_patch = ReversePatch(func, include_set=include_set, exclude_set=exclude_set)
+            cache[key] = (reverse_patch, reverse_patch.__enter__())
+
+        return cache[key][1]
+
+    yield get
+
+    for reverse_patch, _ in reversed(list(cache.values())):
+        reverse_patch.__exit__(None, None, None)
+
+
+@pytest.fixture(scope='class')
+def rp_dto(request):
+    """
+    `ReversePatchDTO` of the target passed via indirect parametrization, entered once per target for the test class.
+
+    ```py
+    @pytest.mark.parametrize('rp_dto', [tm.FirstClass.fail_no_method], indirect=True)
+    def test_something(self, rp_dto):
+        with pytest.raises(AttributeError):
+            rp_dto.c(*rp_dto.args)
+    ```
+    """
+    with ReversePatch(request.param) as rp:
+        yield rp
@@ -2,6 +2,18 @@ import pytest
 import reverse_patch.testing_fixtures as tm
 
 
+@pytest.fixture
+def fc() -> tm.FirstClass:
+    """an instance of `FirstClass`"""
+    return tm.FirstClass()
+
+
+@pytest.fixture
+def cs() -> tm.FirstClass.SecondClass:
+    """an instance of `FirstClass.SecondClass`"""
+    return tm.FirstClass.SecondClass()
+
+
 class TestFailedFunction:
     def test_failed_function(self):
         with pytest.raises(RuntimeError):
@@ -9,9 +21,7 @@ class TestFailedFunction:
 
 
 class TestFirstClass:
-    def test_failed_method(self):
-        fc = tm.FirstClass()
-
+    def test_failed_method(self, fc):
         with pytest.raises(RuntimeError):
             fc.failed_method('a', 'b')
 
@@ -24,9 +34,7 @@ class TestFirstClass:
             tm.FirstClass.failed_static_method('e', 'h')
 
     class TestSecondClass:
-        def test_second_failed_method(self):
-            cs = tm.FirstClass.SecondClass()
-
+        def test_second_failed_method(self, cs):
             with pytest.raises(RuntimeError):
                 cs.second_failed_method('a', 'b')
 
@@ -5,23 +5,32 @@ import pytest
 
 from reverse_patch.patch_logger import PatchLogger
 
-logger = logging.getLogger('some_logger')
+
+@pytest.fixture(scope='session')
+def shared_logger() -> logging.Logger:
+    """the logger patched by tests of `PatchLogger`"""
+    return logging.getLogger('some_logger')
+
+
+METHODS = ('debug', 'info', 'warning', 'error', 'critical')
 
 
 class TestPatchLogger:
-    def test_patch_logger(self):
-        for method_name in ('debug', 'info', 'warning', 'error', 'critical'):
-            _orig_method = getattr(logger, method_name)
+    @pytest.mark.parametrize('method_name', METHODS)
+    def test_patch_logger(self, shared_logger, method_name):
+        logger = shared_logger
+        orig_method = getattr(logger, method_name)
 
-            with PatchLogger(logger):
-                getattr(logger, method_name)('hello %s, %s', 'Bob', 42)
-                cast(Mock, getattr(logger, method_name)).assert_called_once_with('hello %s, %s', 'Bob', 42)
+        with PatchLogger(logger):
+            method = cast(Mock, getattr(logger, method_name))
+            method('hello %s, %s', 'Bob', 42)
+            method.assert_called_once_with('hello %s, %s', 'Bob', 42)
 
-            with PatchLogger(logger):
-                with pytest.raises(TypeError):
-                    getattr(logger, method_name)('hello %s', 'Foo', 1)
+        with PatchLogger(logger):
+            with pytest.raises(TypeError):
+                getattr(logger, method_name)('hello %s', 'Foo', 1)
 
-            assert not isinstance(getattr(logger, method_name), Mock)
+        assert getattr(logger, method_name) == orig_method
 
     def test___mock_log_method(self):
         PatchLogger._mock_log_method('hello %s', 'one')
@@ -30,3 +39,20 @@ class TestPatchLogger:
         with pytest.raises(TypeError):
             PatchLogger._mock_log_method('hello %s')
 
+    def test_restore_instance_method(self, shared_logger):
+        logger = shared_logger
+
+        def info(msg, *args, **kwargs):
+            pass
+
+        logger.info = info  # type: ignore
+
+        try:
+            with PatchLogger(logger):
+                assert isinstance(logger.info, Mock)
+
+            assert logger.info is info
+        finally:
+            del logger.info
+
+        assert 'info' not in logger.__dict__
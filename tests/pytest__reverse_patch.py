@@ -1,11 +1,13 @@
-from typing import cast
+import asyncio
+import sys
 import pytest
-from unittest.mock import NonCallableMock, Mock, MagicMock, patch
+from unittest.mock import NonCallableMock, Mock
 from reverse_patch import (
     ReversePatch,
     ArgsKwargs,
     ArgumentName,
     IdentifierName,
+    IdentifierPath,
     m,
     Rp,
     Rc,
@@ -32,34 +34,36 @@ Wow!! Only three lines, including `def test_success_method(self):`, it is amazin
 """
 
 
-class TestReversePatch:
+@pytest.mark.slow
+class TestReversePatchMockedScope:
     """
-    Unit-tests for ReversePatch itself and at the same time helpful examples, how to work this ReversePatch.
+    Checks of the mocked scope around `FirstClass.success_method`.
 
-    Here we will testing `reverse_patch_data/testing_fixtures.py` module
+    These tests only look at mocks and never call `rp.c(*rp.args)`,
+    thus all of them share one `ReversePatch` entered by the class scoped `rp_cache` fixture.
     """
 
-    def test_module_const(self):
+    def test_module_const(self, rp_cache):
         """
         All identifiers (variables) in testing module `reverse_patch_data/testing_fixtures.py` have to be mocked,
         including string constant `MODULE_CONST`.
 
         Lets check, that `MODULE_CONST` become a Mock
         """
-        with ReversePatch(tm.FirstClass.success_method):
-            assert isinstance(tm.MODULE_CONST, NonCallableMock)
+        rp_cache(tm.FirstClass.success_method)
+        assert isinstance(tm.MODULE_CONST, NonCallableMock)
 
-    def test_first_class_const(self):
+    def test_first_class_const(self, rp_cache):
         """
         All attributes in classes in testing module `reverse_patch_data/testing_fixtures.py` have to be mocked,
         including string constant `FirstClass.first_class_const`.
 
         Lets check, that `FirstClass.first_class_const` become a Mock.
         """
-        with ReversePatch(tm.FirstClass.success_method) as rp:
-            assert isinstance(rp.args[0].first_class_const, NonCallableMock)
+        rp = rp_cache(tm.FirstClass.success_method)
+        assert isinstance(rp.args[0].first_class_const, NonCallableMock)
 
-    def test_second_class__second_class_const(self):
+    def test_second_class__second_class_const(self, rp_cache):
         """
         All attributes in internal class in `testing module.FistClass.SecondClass` have to be mocked,
         including string constant `FirstClass.SecondClass.second_class_const`.
@@ -67,16 +71,16 @@ class TestReversePatch:
 
         Lets check, that `FirstClass.SecondClass.second_class_const` become a Mock.
         """
-        with ReversePatch(tm.FirstClass.success_method) as rp:
-            # Note: rp.args[0] == rp.args.self
-            # if you need access to mocked `FirstClass.SecondClass.second_class_const`,
-            # you have to use rp.args[0] or rp.args.self
-            # Please: don't use `tm.FirstClass.SecondClass.second_class_const`,
-            # because classes that are in path to testing method
-            # are not mocked in `testing module` to stay access for original classes for future.
-            assert isinstance(rp.args[0].SecondClass.second_class_const, NonCallableMock)
+        rp = rp_cache(tm.FirstClass.success_method)
+        # Note: rp.args[0] == rp.args.self
+        # if you need access to mocked `FirstClass.SecondClass.second_class_const`,
+        # you have to use rp.args[0] or rp.args.self
+        # Please: don't use `tm.FirstClass.SecondClass.second_class_const`,
+        # because classes that are in path to testing method
+        # are not mocked in `testing module` to stay access for original classes for future.
+        assert isinstance(rp.args[0].SecondClass.second_class_const, NonCallableMock)
 
-    def test_second_class(self):
+    def test_second_class(self, rp_cache):
         """
         All classes in path to testing method have to be mocked,
         including `FirstClass.SecondClass`.
@@ -84,14 +88,23 @@ class TestReversePatch:
 
         Lets check, that `FirstClass.SecondClass` become a Mock.
         """
-        with ReversePatch(tm.FirstClass.success_method) as rp:
-            # Note: rp.args[0] == rp.args.self
-            # if you need access to mocked `FistClass.SecondClass`
-            # you have to use rp[0] or rp.args.self
-            # Please: don't use `tm.FirstClass.SecondClass`,
-            # because classes that are in path to testing method
-            # are not mocked in `testing module` to stay access for original classes for future.
-            assert isinstance(rp.args[0].SecondClass, Mock)
+        rp = rp_cache(tm.FirstClass.success_method)
+        # Note: rp.args[0] == rp.args.self
+        # if you need access to mocked `FistClass.SecondClass`
+        # you have to use rp[0] or rp.args.self
+        # Please: don't use `tm.FirstClass.SecondClass`,
+        # because classes that are in path to testing method
+        # are not mocked in `testing module` to stay access for original classes for future.
+        assert isinstance(rp.args[0].SecondClass, Mock)
+
+
+@pytest.mark.slow
+class TestReversePatch:
+    """
+    Unit-tests for ReversePatch itself and at the same time helpful examples, how to work this ReversePatch.
+
+    Here we will testing `reverse_patch_data/testing_fixtures.py` module
+    """
 
     def test_success_method(self):
         """
@@ -101,20 +114,24 @@ class TestReversePatch:
         But the `success_method` itself does not contain errors, so this test must be performed successfully.
         """
         with ReversePatch(tm.FirstClass.success_method) as rp:
+            failed_function = m(tm.failed_function)
+            id_ = m(getattr(tm, 'id'))
+
             r = rp.c(*rp.args)
-            assert r == cast(Mock, tm.failed_function).return_value
-            cast(Mock, tm.failed_function).assert_called_once_with(tm.id.return_value)  # noqa
+            assert r == failed_function.return_value
+            failed_function.assert_called_once_with(id_.return_value)
             # Note: rp.args[0] == rp.args.self
             # In the case of `FirstClass.success_method`, see method signature,
             # one can access to mocked `method_argument` like `rp.args[1]` or `rp.args.method_argument`.
-            cast(Mock, getattr(tm, 'id')).assert_called_once_with(rp.args.method_argument)
+            id_.assert_called_once_with(rp.args.method_argument)
 
             # Please, don't use `tm.FirstClass.failed_method`, because class that are in path to testing method
             # are not mocked in `testing_module` to stay access for original classes for future
             # use `rp.args.self.failed_method` or `rp.args[0].failed_method` instead
-            cast(Mock, rp.args.self.failed_method).assert_called_once_with(1, 2)
-            cast(Mock, rp.args[0].failed_class_method).assert_called_once_with(1, 2)
-            cast(Mock, rp.args[0].failed_static_method).assert_called_once_with(1, 2)
+            s = rp.args.self  # the same as `rp.args[0]`
+            m(s.failed_method).assert_called_once_with(1, 2)
+            m(s.failed_class_method).assert_called_once_with(1, 2)
+            m(s.failed_static_method).assert_called_once_with(1, 2)
 
     def test_success_class_method(self):
         """
@@ -124,21 +141,25 @@ class TestReversePatch:
         But the `success_class_method` itself does not contain errors, so this test must be performed successfully.
         """
         with ReversePatch(tm.FirstClass.success_class_method) as rp:
+            failed_function = m(tm.failed_function)
+            id_ = m(getattr(tm, 'id'))
+
             r = rp.c(*rp.args)
-            assert r == cast(Mock, tm.failed_function).return_value
+            assert r == failed_function.return_value
             # None: rp.args[0] == rp.args.cls
             # In the case of `FirstClass.success_class_method`, see method signature,
             # one can access to mocked `class_method_argument` like `rp.args[1]`
             # or `rp.args.class_method_argument`
-            cast(Mock, tm.id).assert_called_once_with(rp.args.class_method_argument)  # noqa
+            id_.assert_called_once_with(rp.args.class_method_argument)
 
             # Please, don't use `tm.FirstClass.failed_class_method`,
             # because class that are in path to testing class method are not mocked in `testing_module`
             # to stay access for original classes for future
             # user `rp.args.cls.failed_class_method` or `rp.args[0].failed_class_method`
-            cast(Mock, rp.args.cls.failed_class_method).assert_called_once_with(1, 2)
-            cast(Mock, rp.args[0].failed_static_method).assert_called_once_with(1, 2)
-            cast(Mock, tm.failed_function).assert_called_once_with(tm.id.return_value)  # noqa
+            cls = rp.args.cls  # the same as `rp.args[0]`
+            m(cls.failed_class_method).assert_called_once_with(1, 2)
+            m(cls.failed_static_method).assert_called_once_with(1, 2)
+            failed_function.assert_called_once_with(id_.return_value)
 
     def test_success_static_method(self):
         """
@@ -150,94 +171,6 @@ class TestReversePatch:
         with ReversePatch(tm.FirstClass.success_static_method) as rp:
             _r = rp.c(*rp.args)
 
-    def test_fail_method__failed_function(self):
-        """
-        Minimal test (without asserts) for `fail_method__failed_function`.
-
-        In this case `fail_method__failed_function` calls other function with wrong signature.
-        Here we catch `TypeError` that raised when trying to call a MagicMock callable with wrong signature
-        """
-        with ReversePatch(tm.FirstClass.fail_method__failed_function) as rp:
-            with pytest.raises(TypeError):
-                rp.c(*rp.args)
-
-    def test_fail_method__failed_method(self):
-        """
-        Minimal test (without asserts) for `fail_method__failed_method`.
-
-        In this case `fail_method__failed_method` calls other function with wrong signature.
-        Here we catch `TypeError` that raised when trying to call a MagicMock callable with wrong signature
-        """
-        with ReversePatch(tm.FirstClass.fail_method__failed_method) as rp:
-            with pytest.raises(TypeError):
-                rp.c(*rp.args)
-
-    def test_fail_method__failed_class_method(self):
-        """
-        Minimal test (without asserts) for `fail_method__failed_class_method`.
-
-        In this case `fail_method__failed_class_method` calls other function with wrong signature.
-        Here we catch `TypeError` that raised when trying to call a MagicMock callable with wrong signature
-        """
-        with ReversePatch(tm.FirstClass.fail_method__failed_class_method) as rp:
-            with pytest.raises(TypeError):
-                rp.c(*rp.args)
-
-    def test_fail_method__failed_static_method(self):
-        """
-        Minimal test (without asserts) for `fail_method__failed_static_method`.
-
-        In this case `fail_method__failed_static_method` calls other function with wrong signature.
-        Here we catch `TypeError` that raised when trying to call a MagicMock callable with wrong signature
-        """
-        with ReversePatch(tm.FirstClass.fail_method__failed_static_method) as rp:
-            with pytest.raises(TypeError):
-                rp.c(*rp.args)
-
-    def test_fail_class_method__failed_function(self):
-        """
-        Minimal test (without asserts) for `fail_class_method__failed_function`.
-
-        In this case `fail_class_method__failed_function` calls other function with wrong signature.
-        Here we catch `TypeError` that raised when trying to call a MagicMock callable with wrong signature
-        """
-        with ReversePatch(tm.FirstClass.fail_class_method__failed_function) as rp:
-            with pytest.raises(TypeError):
-                rp.c(*rp.args)
-
-    def test_fail_class_method__failed_class_method(self):
-        """
-        Minimal test (without asserts) for `fail_class_method__failed_class_method`.
-
-        In this case `fail_class_method__failed_class_method` calls other function with wrong signature.
-        Here we catch `TypeError` that raised when trying to call a MagicMock callable with wrong signature
-        """
-        with ReversePatch(tm.FirstClass.fail_class_method__failed_class_method) as rp:
-            with pytest.raises(TypeError):
-                rp.c(*rp.args)
-
-    def test_fail_class_method__failed_static_method(self):
-        """
-        Minimal test (without asserts) for `fail_class_method__failed_static_method`.
-
-        In this case `fail_class_method__failed_static_method` calls other function with wrong signature.
-        Here we catch `TypeError` that raised when trying to call a MagicMock callable with wrong signature
-        """
-        with ReversePatch(tm.FirstClass.fail_class_method__failed_static_method) as rp:
-            with pytest.raises(TypeError):
-                rp.c(*rp.args)
-
-    def test_fail_static_method__failed_function(self):
-        """
-        Minimal test (without asserts) for `fail_static_method__failed_functions`.
-
-        In this case `fail_static_method__failed_functions` calls other function with wrong signature.
-        Here we catch `TypeError` that raised when trying to call a MagicMock callable with wrong signature
-        """
-        with ReversePatch(tm.FirstClass.fail_static_method__failed_functions) as rp:
-            with pytest.raises(TypeError):
-                rp.c(*rp.args)
-
     def test_second_success_method(self):
         """
         Minimal test (without asserts) for `FirstClass.SecondClass.second_success_method`
@@ -271,90 +204,6 @@ class TestReversePatch:
         with ReversePatch(tm.FirstClass.SecondClass.second_success_static_method) as rp:
             rp.c(*rp.args)
 
-    def test_second_fail_method__failed_function(self):
-        """
-        Minimal test (without asserts) for `FirstClass.SecondClass.second_fail_method__failed_function`
-
-        In this case `FirstClass.SecondClass.second_fail_method__failed_function`
-        calls other function with wrong signature.
-        Here we catch `TypeError` that raised when trying to call a MagicMock callable with wrong signature
-        """
-        with ReversePatch(tm.FirstClass.SecondClass.second_fail_method__failed_function) as rp:
-            with pytest.raises(TypeError):
-                rp.c(*rp.args)
-
-    def test_second_fail_method__failed_method(self):
-        """
-        Minimal test (without asserts) for `FirstClass.SecondClass.second_fail_method__failed_method`
-
-        In this case `FirstClass.SecondClass.second_fail_method__failed_method`
-        calls other function with wrong signature.
-        Here we catch `TypeError` that raised when trying to call a MagicMock callable with wrong signature
-        """
-        with ReversePatch(tm.FirstClass.SecondClass.second_fail_method__failed_method) as rp:
-            with pytest.raises(TypeError):
-                rp.c(*rp.args)
-
-    def test_second_fail_method__failed_class_method(self):
-        """
-        Minimal test (without asserts) for `FirstClass.SecondClass.second_fail_method__failed_class_method`
-
-        In this case `FirstClass.SecondClass.second_fail_method__failed_class_method`
-        calls other function with wrong signature.
-        Here we catch `TypeError` that raised when trying to call a MagicMock callable with wrong signature
-        """
-        with ReversePatch(tm.FirstClass.SecondClass.second_fail_method__failed_class_method) as rp:
-            with pytest.raises(TypeError):
-                rp.c(*rp.args)
-
-    def test_second_fail_method__failed_static_method(self):
-        """
-        Minimal test (without asserts) for `FirstClass.SecondClass.second_fail_method__failed_static_method`
-
-        In this case `FirstClass.SecondClass.second_fail_method__failed_static_method`
-        calls other function with wrong signature.
-        Here we catch `TypeError` that raised when trying to call a MagicMock callable with wrong signature
-        """
-        with ReversePatch(tm.FirstClass.SecondClass.second_fail_method__failed_static_method) as rp:
-            with pytest.raises(TypeError):
-                rp.c(*rp.args)
-
-    def test_second_fail_class_method__failed_function(self):
-        """
-        Minimal test (without asserts) for `FirstClass.SecondClass.second_fail_class_method__failed_function`
-
-        In this case `FirstClass.SecondClass.second_fail_class_method__failed_function`
-        calls other function with wrong signature.
-        Here we catch `TypeError` that raised when trying to call a MagicMock callable with wrong signature
-        """
-        with ReversePatch(tm.FirstClass.SecondClass.second_fail_class_method__failed_function) as rp:
-            with pytest.raises(TypeError):
-                rp.c(*rp.args)
-
-    def test_second_fail_class_method__failed_class_method(self):
-        """
-        Minimal test (without asserts) for `FirstClass.SecondClass.second_fail_class_method__failed_class_method`
-
-        In this case `FirstClass.SecondClass.second_fail_class_method__failed_class_method`
-        calls other function with wrong signature.
-        Here we catch `TypeError` that raised when trying to call a MagicMock callable with wrong signature
-        """
-        with ReversePatch(tm.FirstClass.SecondClass.second_fail_class_method__failed_class_method) as rp:
-            with pytest.raises(TypeError):
-                rp.c(*rp.args)
-
-    def test_second_fail_class_method__failed_static_method(self):
-        """
-        Minimal test (without asserts) for `FirstClass.SecondClass.second_fail_class_method__failed_static_method`.
-
-        In this case `FirstClass.SecondClass.second_fail_class_method__failed_static_method`
-        calls other function with wrong signature.
-        Here we catch `TypeError` that raised when trying to call a MagicMock callable with wrong signature
-        """
-        with ReversePatch(tm.FirstClass.SecondClass.second_fail_class_method__failed_static_method) as rp:
-            with pytest.raises(TypeError):
-                rp.c(*rp.args)
-
     def test_success_function(self):
         """
         Minimal test (without asserts) for `success_function`.
@@ -366,72 +215,6 @@ class TestReversePatch:
         with ReversePatch(tm.success_function) as rp:
             rp.c(*rp.args)
 
-    def test_fail__failed_function(self):
-        """
-        Minimal test (without asserts) for `fail__failed_function`.
-
-        In this case `fail__failed_function` calls other function with wrong signature.
-        Here we catch `TypeError` that raised when trying to call a MagicMock callable with wrong signature
-        """
-        with ReversePatch(tm.fail__failed_function) as rp:
-            with pytest.raises(TypeError):
-                rp.c(*rp.args)
-
-    def test_fail_no_method(self):
-        """
-        Minimal test (without asserts) for `FirstClass.fail_no_method`.
-
-        In this case `FirstClass.fail_no_method` try to call a method that does not exist.
-        Here we catch `AttributeError`.
-        """
-        with ReversePatch(tm.FirstClass.fail_no_method) as rp:
-            with pytest.raises(AttributeError):
-                rp.c(*rp.args)
-
-    def test_fail_no_function(self):
-        """
-        Minimal test (without asserts) for `FirstClass.fail_no_function`.
-
-        In this case `FirstClass.fail_no_function` try to call a global function that does not exist.
-        Here we catch `NameError`.
-        """
-        with ReversePatch(tm.FirstClass.fail_no_function) as rp:
-            with pytest.raises(NameError):
-                rp.c(*rp.args)
-
-    def test_fail_no_function1(self):
-        """
-        Minimal test (without asserts) for `fail_no_function1`.
-
-        In this case `fail_no_function1` try to call a global function that does not exist.
-        Here we catch `NameError`.
-        """
-        with ReversePatch(tm.fail_no_function1) as rp:
-            with pytest.raises(NameError):
-                rp.c(*rp.args)
-
-    def test_second_fail_no_method(self):
-        """
-        Minimal test (without asserts) for `FirstClass.SecondClass.second_fail_no_method`.
-
-        In this case `FirstClass.SecondClass.second_fail_no_method` try to call a method that does not exist.
-        Here we catch `AttributeError`.
-        """
-        with ReversePatch(tm.FirstClass.SecondClass.second_fail_no_method) as rp:
-            with pytest.raises(AttributeError):
-                rp.c(*rp.args)
-
-    def test_second_fail_no_function(self):
-        """
-        Minimal test (without asserts) for `FirstClass.SecondClass.second_fail_no_function`.
-
-        In this case `FirstClass.SecondClass.second_fail_no_function` try to call a function that does not exist.
-        Here we catch `NameError`.
-        """
-        with ReversePatch(tm.FirstClass.SecondClass.second_fail_no_function) as rp:
-            with pytest.raises(NameError):
-                rp.c(*rp.args)
-
     def test_success_static_method__include(self):
         """
         We put `type` in `include_set`,
@@ -442,6 +225,25 @@ class TestReversePatch:
             r = rp.c(*rp.args)
             assert r == m(m(tm).type).return_value
 
+    def test_include_path(self):
+        """Qualified names in `include_set` are created in their parent as MagicMock and removed after"""
+        with ReversePatch(tm.FirstClass.success_method, include_set={IdentifierPath('FirstClass.new_attr')}):
+            assert isinstance(getattr(tm.FirstClass, 'new_attr'), Mock)
+
+        assert not hasattr(tm.FirstClass, 'new_attr')
+
+    @pytest.mark.skipif(sys.version_info < (3, 8), reason='AsyncMock is new in python 3.8')
+    def test_include_path__async(self):
+        """Coroutine functions in `include_set` are patched with AsyncMock, like `patch` does"""
+        from unittest.mock import AsyncMock
+
+        with ReversePatch(tm.FirstClass.success_method, include_set={IdentifierPath('FirstClass.async_method')}):
+            assert isinstance(tm.FirstClass.async_method, AsyncMock)
+            asyncio.run(tm.FirstClass.async_method())
+            m(tm.FirstClass.async_method).assert_awaited_once_with()
+
+        assert not isinstance(tm.FirstClass.async_method, Mock)
+
     def test_success_static_method__exclude(self):
         """
         `id` is mocked by default.
@@ -451,6 +253,22 @@ class TestReversePatch:
             r = rp.c(*rp.args)
             assert isinstance(r, int)
 
+    def test_include_magic(self):
+        """
+        Mocked arguments are `MagicMock` instances by default.
+        Use `include_magic=False` to get plain `Mock` arguments, those do not support magic methods like `__len__`.
+        """
+        with ReversePatch(tm.FirstClass.success_method) as rp:
+            assert len(rp.args.method_argument) == 0
+
+        with ReversePatch(tm.FirstClass.success_method, include_magic=False) as rp:
+            assert isinstance(rp.args.method_argument, Mock)
+
+            with pytest.raises(TypeError):
+                len(rp.args.method_argument)
+
+            rp.c(*rp.args)
+
     def test_use_attrs_inited_in__init(self):
         """
         `x` and `y` attribute creates in `__init__`, these are not attributes of the class,
@@ -479,10 +297,15 @@ class TestReversePatch:
         # You have to mock all attributes of an instance of the class using in testing method.
         # This way may be expensive
         # Note: here we use 40 and 50, not mock objects, because in python3.10 will 'Cannot autospec a Mock object'
-        with patch.object(tm.InitCase, 'x', 40, create=True):  # mock 1
-            with patch.object(tm.InitCase, 'y', 50, create=True):  # mock 2
-                with ReversePatch(tm.InitCase.use_attrs_inited_in__init) as rp:
-                    rp.c(*rp.args)
+        # `InitCase` has no `x` and `y` attributes, so set them directly and delete them afterward
+        tm.InitCase.x = 40  # type: ignore  # mock 1
+        tm.InitCase.y = 50  # type: ignore  # mock 2
+        try:
+            with ReversePatch(tm.InitCase.use_attrs_inited_in__init) as rp:
+                rp.c(*rp.args)
+        finally:
+            del tm.InitCase.x  # type: ignore
+            del tm.InitCase.y  # type: ignore
         # endregion expensive_way
 
         # region more_short_expensive_way
@@ -504,19 +327,32 @@ class TestReversePatch:
         # endregion run_init_before
 
         # region exclude_set
-        with ReversePatch(tm.InitCase.use_attrs_inited_in__init, exclude_set={tm.InitCase.__init__}) as rp:
-            rp.exclusions[tm.InitCase.__init__].c(*rp.exclusions[tm.InitCase.__init__].args)
-            rp.c(*rp.args)
-
+        # `exclude_set={tm.InitCase.__init__}` is the same, objects are excluded by their paths, see `test_exclusions`
         with ReversePatch(tm.InitCase.use_attrs_inited_in__init, exclude_set={'InitCase.__init__'}) as rp:
-            rp.exclusions[tm.InitCase.__init__].c(*rp.exclusions[tm.InitCase.__init__].args)
-            rp.c(*rp.args)
-
-        with ReversePatch(tm.InitCase.use_attrs_inited_in__init, exclude_set={'InitCase.__init__'}) as rp:
-            rp.exclusions[tm.InitCase.__init__].c(*rp.exclusions['InitCase.__init__'].args)
+            init_exclusion = rp.exclusions['InitCase.__init__']
+            assert rp.exclusions[tm.InitCase.__init__] is init_exclusion
+            init_exclusion.c(*init_exclusion.args)
             rp.c(*rp.args)
         # endregion exclude_set
 
+    def test_exit_all_patchers_on_error(self):
+        class FailedPatcher:
+            def __enter__(self):
+                pass
+
+            def __exit__(self, exc_type, exc_val, exc_tb):
+                raise RuntimeError('failed patcher')
+
+        reverse_patch = ReversePatch(tm.FirstClass.success_method)
+        reverse_patch.__enter__()
+        reverse_patch._patchers.append(FailedPatcher())  # noqa
+
+        with pytest.raises(RuntimeError, match='failed patcher'):
+            reverse_patch.__exit__(None, None, None)
+
+        assert not isinstance(tm.MODULE_CONST, NonCallableMock)
+        reverse_patch.__exit__(None, None, None)  # patchers are cleared, exiting twice does nothing
+
     def test_exclusions(self):
         with ReversePatch(tm.FirstClass.success_method, exclude_set={'FirstClass.first_class_const'}) as rp:
             assert rp.exclusions['FirstClass.first_class_const'].o
@@ -529,6 +365,12 @@ class TestReversePatch:
             assert rp.exclusions['FirstClass.failed_method'].c
             assert rp.exclusions[tm.FirstClass.failed_method].c
 
+        # `SecondClass` is in the path to the excluded object, but not in the path to the testing method
+        second_class_const = tm.FirstClass.SecondClass.second_class_const
+        with ReversePatch(tm.FirstClass.success_method, exclude_set={'FirstClass.SecondClass.second_class_const'}) as rp:
+            assert rp.exclusions['FirstClass.SecondClass.second_class_const'].o == second_class_const
+            assert rp.args.self.SecondClass.second_class_const == second_class_const
+
     def test_do_log_debug_success(self):
         with ReversePatch(tm.do_log_debug_success, exclude_set={'logging', 'logger'}) as rp:
             with PatchLogger(tm.logger):
@@ -549,27 +391,30 @@ class TestReversePatch:
             with Rcl(tm.do_log_debug_fail):
                 pass
 
-    def test_rp_dto_unpack(self):
-        with ReversePatch(tm.FirstClass.success_method) as (rp, c, args, s):
+    @pytest.mark.parametrize('ctx,target,slot', [
+        (ReversePatch, tm.FirstClass.success_method, 'self'),
+        (ReversePatch, tm.FirstClass.success_class_method, 'cls'),
+        (ReversePatch, tm.FirstClass.success_static_method, None),
+        (Rc, tm.FirstClass.success_method, 'self'),
+        (Rc, tm.FirstClass.success_class_method, 'cls'),
+        (Rc, tm.FirstClass.success_static_method, None),
+    ], ids=lambda value: getattr(value, '__qualname__', str(value)))
+    def test_dto_unpack(self, ctx, target, slot):
+        """
+        `ReversePatch` can be unpacked like `with ReversePatch(f) as (rp, c, args, s)`,
+        `Rc` is more short and convenient way, like `with Rc(f) as (r, rc, c, args, s)`.
+        """
+        with ctx(target) as dto:
+            *r, rp, c, args, s = dto
+            assert r == ([dto.r] if ctx is Rc else [])  # only `Rc` yields its result first
+            assert rp is dto
             assert rp.c == c
             assert rp.args == args
-            assert rp.args.self == s
+            assert s == (getattr(rp.args, slot) if slot else None)
 
-        with ReversePatch(tm.FirstClass.success_class_method) as (rp, c, args, cls):
-            assert rp.c == c
-            assert rp.args == args
-            assert rp.args.cls == cls
-
-        with ReversePatch(tm.FirstClass.success_static_method) as (rp, c, args, s):
-            assert rp.c == c
-            assert rp.args == args
-            assert s is None
-        # check short form
-        with ReversePatch(tm.FirstClass.success_static_method) as (rp, c, *_):
-            assert rp.c == c
-
-        with ReversePatch(tm.FirstClass.success_method) as (rp, *_, s):
-            assert rp.args.self == s
+            # check short form
+            *_, s_ = dto
+            assert s_ == s
 
     def test_skip_exception_classes(self):
         with ReversePatch(tm.raise_some_exception) as rp:
@@ -602,57 +447,79 @@ class TestReversePatch:
             # do not need `r = rp.c(*rp.args)`
             assert rc.r == m(tm.failed_function).return_value
 
-    def test_rc_dto_unpack(self):
+
+@pytest.mark.slow
+class TestReversePatchFailures:
+    """
+    Failing targets, each test gets `ReversePatchDTO` of its target from the class scoped `rp_dto` fixture.
+
+    The fixture is parametrized indirectly, so the `ReversePatch` context is entered once per target.
+    """
+
+    @pytest.mark.parametrize('rp_dto', [
+        tm.FirstClass.fail_method__failed_function,
+        tm.FirstClass.fail_method__failed_method,
+        tm.FirstClass.fail_method__failed_class_method,
+        tm.FirstClass.fail_method__failed_static_method,
+        tm.FirstClass.fail_class_method__failed_function,
+        tm.FirstClass.fail_class_method__failed_class_method,
+        tm.FirstClass.fail_class_method__failed_static_method,
+        tm.FirstClass.fail_static_method__failed_functions,
+        tm.FirstClass.SecondClass.second_fail_method__failed_function,
+        tm.FirstClass.SecondClass.second_fail_method__failed_method,
+        tm.FirstClass.SecondClass.second_fail_method__failed_class_method,
+        tm.FirstClass.SecondClass.second_fail_method__failed_static_method,
+        tm.FirstClass.SecondClass.second_fail_class_method__failed_function,
+        tm.FirstClass.SecondClass.second_fail_class_method__failed_class_method,
+        tm.FirstClass.SecondClass.second_fail_class_method__failed_static_method,
+        tm.fail__failed_function,
+    ], indirect=True, ids=lambda target: target.__qualname__)
+    def test_fail__type_error(self, rp_dto):
+        """
+        Minimal test (without asserts) for each `fail_*__failed_*` method or function.
+
+        In this case the target calls other function with wrong signature.
+        Here we catch `TypeError` that raised when trying to call a MagicMock callable with wrong signature
         """
-        Use `Rc` instead of `Rp` or `ReversePatch`.
-        This is more short and convenient way.
+        pytest.raises(TypeError, rp_dto.c, *rp_dto.args)
+
+    @pytest.mark.parametrize('rp_dto', [
+        tm.FirstClass.fail_no_method,
+        tm.FirstClass.SecondClass.second_fail_no_method,
+    ], indirect=True, ids=lambda target: target.__qualname__)
+    def test_fail__attribute_error(self, rp_dto):
         """
-        with Rc(tm.FirstClass.success_method) as (r, rc, c, args, s):
-            assert rc.r == r
-            assert rc.c == c
-            assert rc.args == args
-            assert rc.args.self == s
+        Minimal test (without asserts) for `fail_no_method` methods.
 
-        with Rc(tm.FirstClass.success_class_method) as (r, rc, c, args, cls):
-            assert rc.r == r
-            assert rc.c == c
-            assert rc.args == args
-            assert rc.args.cls == cls
+        In this case the target try to call a method that does not exist.
+        Here we catch `AttributeError`.
+        """
+        pytest.raises(AttributeError, rp_dto.c, *rp_dto.args)
 
-        with Rc(tm.FirstClass.success_static_method) as (r, rc, c, args, s):
-            assert rc.r == r
-            assert rc.c == c
-            assert rc.args == args
-            assert s is None
-        # check short form
-        with Rc(tm.FirstClass.success_static_method) as (r, rc, c, *_):
-            assert rc.r == r
-            assert rc.c == c
+    @pytest.mark.parametrize('rp_dto', [
+        tm.FirstClass.fail_no_function,
+        tm.FirstClass.SecondClass.second_fail_no_function,
+        tm.fail_no_function1,
+    ], indirect=True, ids=lambda target: target.__qualname__)
+    def test_fail__name_error(self, rp_dto):
+        """
+        Minimal test (without asserts) for `fail_no_function` methods and functions.
 
-        with Rc(tm.FirstClass.success_method) as (r, rc, *_, s):
-            assert rc.r == r
-            assert rc.args.self == s
+        In this case the target try to call a global function that does not exist.
+        Here we catch `NameError`.
+        """
+        pytest.raises(NameError, rp_dto.c, *rp_dto.args)
 
 
 class TestArgsKwargs:
     def test_args_kwargs(self):
+        expected = ('_cls', '_self', '_foo', '_bar')
         args_kwargs = ArgsKwargs()
-        args_kwargs.add_argument(ArgumentName('cls'), cast(MagicMock, '_cls'))
-        args_kwargs.add_argument(ArgumentName('self'), cast(MagicMock, '_self'))
-        args_kwargs.add_argument(ArgumentName('foo'), cast(MagicMock, '_foo'))
-        args_kwargs.add_argument(ArgumentName('bar'), cast(MagicMock, '_bar'))
-        assert args_kwargs.cls == '_cls'
-        assert args_kwargs.self == '_self'
-        assert args_kwargs.foo == '_foo'
-        assert args_kwargs.bar == '_bar'
-
-        assert args_kwargs[0] == '_cls'
-        assert args_kwargs[1] == '_self'
-        assert args_kwargs[2] == '_foo'
-        assert args_kwargs[3] == '_bar'
-
-        unpacked = [*args_kwargs]
-        assert unpacked == ['_cls', '_self', '_foo', '_bar']
+        args_kwargs.add_arguments(zip(map(ArgumentName, ('cls', 'self', 'foo', 'bar')), expected))
+
+        assert (args_kwargs.cls, args_kwargs.self, args_kwargs.foo, args_kwargs.bar) == expected
+        assert tuple(args_kwargs[i] for i in range(4)) == expected
+        assert tuple(args_kwargs) == expected  # unpacking
 
         # region setattr
         args_kwargs.foo = '_new_foo'
@@ -660,6 +527,25 @@ class TestArgsKwargs:
         assert args_kwargs[2] == '_new_foo'
         # endregion setattr
 
+        with pytest.raises(AttributeError):
+            args_kwargs.no_argument  # noqa, `AttributeError`, not `KeyError`
+
+        assert args_kwargs.get_argument(ArgumentName('cls')) == '_cls'
+        assert args_kwargs.get_argument(ArgumentName('no_argument')) is None
+        assert args_kwargs.get_argument(ArgumentName('no_argument'), '_default') == '_default'
+
+        # region add_argument_twice
+        args_kwargs.add_argument(ArgumentName('foo'), '_last_foo')
+        assert args_kwargs.foo == '_last_foo'
+        assert args_kwargs[4] == '_last_foo'
+        # endregion add_argument_twice
+
+        # region add_arguments_after_added
+        args_kwargs.add_arguments([(ArgumentName('baz'), '_baz'), (ArgumentName('bar'), '_last_bar')])
+        assert (args_kwargs.baz, args_kwargs.bar) == ('_baz', '_last_bar')
+        assert tuple(args_kwargs[5:]) == ('_baz', '_last_bar')
+        # endregion add_arguments_after_added
+
 
 class TestUtilsM:
     def test_m(self):